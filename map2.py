@@ -1,7 +1,12 @@
+import asyncio
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import aiohttp
+import orjson
 import streamlit as st
-import requests
-import pandas as pd
-from pyproj import Transformer
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 # --- 페이지 설정 (가장 먼저 실행) ---
 st.set_page_config(
@@ -11,7 +16,9 @@ st.set_page_config(
 )
 
 # --- 커스텀 CSS ---
-st.markdown("""
+# 스타일과 HTML 래퍼는 모듈 상수로 한 번만 만들어 둡니다.
+# 화면은 rerun마다 처음부터 다시 그려지므로 스타일 요소 자체는 매번 내보내야 합니다.
+CUSTOM_CSS = """
 <style>
     /* 전체 배경 */
     .main {
@@ -110,7 +117,14 @@ st.markdown("""
         margin-top: 1rem;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+RESULT_CARD_OPEN = '<div class="result-card">'
+MAP_CONTAINER_OPEN = '<div class="map-container">'
+DIV_CLOSE = '</div>'
+STAT_BOX = '<div class="stat-box">{label}<br/>{count}개</div>'
+
+st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
 # --- API 키 로딩 ---
 try:
@@ -124,135 +138,241 @@ except (KeyError, FileNotFoundError):
     st.stop()
 
 # --- 헬퍼 함수: 좌표계 변환 (수정된 버전) ---
+# 네이버 지역 검색 API의 mapx/mapy는 WGS84 경위도에 10^7을 곱한 정수입니다.
+# 투영 변환(pyproj)이 필요 없으므로 상수 배율만 한 번 정의해 둡니다.
+NAVER_COORD_SCALE = 1e-7
+
 def convert_tm_to_wgs84(x, y):
     """
     네이버 지역 검색 API의 좌표를 위경도(WGS84)로 변환합니다.
     입력값이 TM좌표계가 아닌, 10^7이 곱해진 정수 형태이므로 직접 변환합니다.
+    변환할 수 없거나 대한민국 범위를 벗어난 좌표는 (None, None)을 반환합니다.
     """
+    # 1. 입력값을 정수로 변환 (None 이거나 숫자가 아니면 실패)
     try:
-        # 1. 입력값이 유효한지 확인 (None 이거나 비어있는 경우)
-        if x is None or y is None:
-            return None, None
+        xi = int(x)
+        yi = int(y)
+    except (ValueError, TypeError):
+        return None, None
 
-        # 2. 입력값을 float 형태로 변환. 실패 시 예외 처리
-        x_val = float(x)
-        y_val = float(y)
+    # 2. 나누기 전에 정수 상태로 대한민국 범위(경도 124~132, 위도 33~43)를 확인
+    # 네이버 지역검색 API는 경도(lon)가 x, 위도(lat)가 y에 해당합니다.
+    if not (1_240_000_000 < xi < 1_320_000_000 and 330_000_000 < yi < 430_000_000):
+        return None, None
 
-        # 3. 10,000,000 으로 나누어 실제 위경도 값으로 변환
-        # 네이버 지역검색 API는 경도(lon)가 x, 위도(lat)가 y에 해당합니다.
-        lon = x_val / 10000000.0
-        lat = y_val / 10000000.0
+    # 3. 10^-7 을 곱해 실제 위경도 값으로 변환
+    return yi * NAVER_COORD_SCALE, xi * NAVER_COORD_SCALE
+
+# --- 헬퍼 함수: 한국 범위 좌표 필터 ---
+def _korea_mask(df):
+    """위도/경도가 대한민국 범위 안에 있는 행을 True로 표시하는 불리언 배열을 반환합니다."""
+    lat = df['위도'].to_numpy(dtype=float)
+    lon = df['경도'].to_numpy(dtype=float)
+    # NaN과의 비교는 항상 False이므로 범위 비교만으로 결측값도 걸러집니다.
+    return (lat > 33) & (lat < 43) & (lon > 124) & (lon < 132)
+
+# --- 비동기 HTTP 클라이언트 ---
+@st.cache_resource
+def _event_loop():
+    """aiohttp 세션이 묶이는 이벤트 루프를 백그라운드 스레드에서 계속 실행합니다."""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return loop
+
+def _submit(coro):
+    """코루틴을 공용 이벤트 루프에 예약하고 concurrent.futures.Future를 반환합니다."""
+    return asyncio.run_coroutine_threadsafe(coro, _event_loop())
+
+def _thread_pool(max_workers):
+    """현재 ScriptRunContext를 워커 스레드에 전달하는 스레드 풀을 만듭니다. (캐시된 동기 함수 병렬 실행용)"""
+    ctx = get_script_run_ctx()
+    return ThreadPoolExecutor(
+        max_workers=max_workers,
+        initializer=lambda: add_script_run_ctx(threading.current_thread(), ctx)
+    )
+
+# 외부 API가 느려도 화면이 멈추지 않도록 연결 2초, 응답 읽기 5초로 제한합니다.
+HTTP_TIMEOUT = aiohttp.ClientTimeout(sock_connect=2, sock_read=5)
+# 일시적인 오류는 짧은 지수 백오프(0.2초, 0.4초)로 최대 2번 재시도합니다.
+HTTP_RETRIES = 2
+HTTP_BACKOFF = 0.2
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+@st.cache_resource
+def _http_session():
+    """rerun 사이에서도 keep-alive 연결을 재사용하는 공용 aiohttp 세션입니다."""
+    async def create():
+        connector = aiohttp.TCPConnector(limit=10, keepalive_timeout=30)
+        return aiohttp.ClientSession(connector=connector, timeout=HTTP_TIMEOUT)
+    return _submit(create()).result()
+
+async def _get_json(session, url, headers, params):
+    for attempt in range(HTTP_RETRIES + 1):
+        last_attempt = attempt == HTTP_RETRIES
+        try:
+            async with session.get(url, headers=headers, params=params) as response:
+                if last_attempt or response.status not in RETRY_STATUSES:
+                    response.raise_for_status()
+                    return orjson.loads(await response.read())
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if last_attempt:
+                raise
+        # 응답 컨텍스트를 벗어나 연결을 풀에 돌려준 뒤에 기다렸다가 재시도합니다.
+        await asyncio.sleep(HTTP_BACKOFF * 2 ** attempt)
 
-        # 4. 변환된 좌표가 대한민국 범위 내에 있는지 최종 확인
-        if not (33 < lat < 43 and 124 < lon < 132):
-            st.write(f"DEBUG - 변환된 좌표({lat}, {lon})가 유효 범위를 벗어났습니다.")
-            return None, None
+# --- API 호출 함수들 ---
+# 응답은 st.cache_data로 캐싱합니다. 오류는 캐싱되지 않도록 예외로 올려 보내고 호출한 쪽에서 표시합니다.
+API_CACHE = dict(ttl=3600, max_entries=512, show_spinner=False)
 
-        return lat, lon
+# 검색 결과는 행(dict) 목록이 아닌 컬럼별 리스트로 모아 pd.DataFrame이 바로 컬럼 단위로 만들도록 합니다.
+# 결과가 없으면 리스트를 만들기 전에 바로 빈 결과를 반환합니다.
+def _empty_places():
+    return {"이름": [], "주소": [], "위도": [], "경도": []}
 
-    except (ValueError, TypeError) as e:
-        # 숫자로 변환할 수 없는 값이 들어왔을 때 오류를 기록하고 None을 반환
-        st.write(f"좌표 변환 중 예외 발생: 입력값({x}, {y}), 오류({e})")
-        return None, None
-    except Exception as e:
-        # 기타 예상치 못한 오류 발생 시
-        st.write(f"알 수 없는 좌표 변환 오류: {e}")
-        return None, None
-# --- API 호출 함수들 ---
+def place_count(places):
+    return len(places["이름"]) if places else 0
 
 # 1. 티맵 POI 검색 함수
-def search_tmap(keyword, count=10):
+async def _fetch_tmap(session, keyword, count):
     url = "https://apis.openapi.sk.com/tmap/pois"
     headers = {"appKey": TMAP_API_KEY, "Accept": "application/json"}
     params = {"version": "1", "searchKeyword": keyword, "count": count, "searchtypCd": "A", "resCoordType": "WGS84GEO"}
-    try:
-        response = requests.get(url, headers=headers, params=params)
-        response.raise_for_status()
-        data = response.json()
-        places = []
-        if data.get("searchPoiInfo", {}).get("totalCount", "0") != "0":
-            for item in data["searchPoiInfo"]["pois"]["poi"]:
-                places.append({
-                    "이름": item.get("name", ""),
-                    "주소": item.get("newAddressList", {}).get("newAddress", [{}])[0].get("fullAddressRoad", ""),
-                    "위도": float(item.get("frontLat", 0)),
-                    "경도": float(item.get("frontLon", 0))
-                })
-        return places
-    except Exception as e:
-        st.error(f"⚠️ 티맵 API 오류: {e}")
-        return None
+    data = await _get_json(session, url, headers, params)
+    info = data.get("searchPoiInfo")
+    if not info or info.get("totalCount", "0") == "0":
+        return _empty_places()
+
+    pois = info["pois"]["poi"]
+    return {
+        "이름": [item.get("name", "") for item in pois],
+        "주소": [item.get("newAddressList", {}).get("newAddress", [{}])[0].get("fullAddressRoad", "") for item in pois],
+        "위도": [float(item.get("frontLat", 0)) for item in pois],
+        "경도": [float(item.get("frontLon", 0)) for item in pois]
+    }
+
+@st.cache_data(**API_CACHE)
+def search_tmap(keyword, count=10):
+    return _submit(_fetch_tmap(_http_session(), keyword, count)).result()
 
 # 2. 네이버 지역 검색(상호명) 함수
-# 2. 네이버 지역 검색(상호명) 함수
-def search_naver_local(keyword, display, sort):
+# 검색어 강조용 <b>, </b> 태그를 한 번에 제거하기 위한 정규식
+BOLD_TAG_RE = re.compile(r"</?b>")
+
+async def _fetch_naver_local(session, keyword, display, sort):
     url = "https://openapi.naver.com/v1/search/local.json"
     headers = {"X-Naver-Client-Id": NAVER_CLIENT_ID, "X-Naver-Client-Secret": NAVER_CLIENT_SECRET}
     params = {"query": keyword, "display": display, "sort": sort}
-    try:
-        response = requests.get(url, headers=headers, params=params)
-        response.raise_for_status()
-        data = response.json()
-        places = []
-        if data.get("total", 0) > 0 and data.get("items"):
-            for item in data["items"]:
-                name = item.get("title", "").replace("<b>", "").replace("</b>", "")
-                mapx = item.get("mapx")
-                mapy = item.get("mapy")
-
-                # (수정) 아래 두 줄의 디버그 메시지를 삭제했습니다.
-                # st.write(f"DEBUG - {name}: mapx={mapx}, mapy={mapy}")
-                lat, lon = convert_tm_to_wgs84(mapx, mapy) if mapx and mapy else (None, None)
-                # st.write(f"  → 변환 후: lat={lat}, lon={lon}")
-
-                if lat and lon:
-                    places.append({
-                        "이름": name,
-                        "주소": item.get("roadAddress", ""),
-                        "위도": lat,
-                        "경도": lon
-                    })
-        return places
-    except Exception as e:
-        st.error(f"네이버 API 오류: {e}")
-        return None
+    data = await _get_json(session, url, headers, params)
+    items = data.get("items")
+    if data.get("total", 0) <= 0 or not items:
+        return _empty_places()
+
+    # 좌표를 변환한 뒤, 대한민국 범위 안의 항목만 남깁니다.
+    places = [
+        (item, *convert_tm_to_wgs84(item.get("mapx"), item.get("mapy")))
+        for item in items
+    ]
+    places = [(item, lat, lon) for item, lat, lon in places if lat is not None]
+    return {
+        "이름": [BOLD_TAG_RE.sub("", item.get("title", "")) for item, _, _ in places],
+        "주소": [item.get("roadAddress", "") for item, _, _ in places],
+        "위도": [lat for _, lat, _ in places],
+        "경도": [lon for _, _, lon in places]
+    }
+
+@st.cache_data(**API_CACHE)
+def search_naver_local(keyword, display, sort):
+    return _submit(_fetch_naver_local(_http_session(), keyword, display, sort)).result()
 
 
 # 3. 네이버 지오코딩(주소) 함수
-def search_naver_geocode(query):
+async def _fetch_naver_geocode(session, query):
     url = "https://maps.apigw.ntruss.com/map-geocode/v2/geocode"
     headers = {"x-ncp-apigw-api-key-id": NCP_CLIENT_ID, "x-ncp-apigw-api-key": NCP_CLIENT_SECRET}
     params = {"query": query}
-    try:
-        response = requests.get(url, headers=headers, params=params)
-        response.raise_for_status()
-        data = response.json()
-        places = []
-        if data.get("status") == "OK" and data.get("addresses"):
-            addr = data["addresses"][0]
-            places.append({
-                "이름": addr.get("roadAddress", "주소 정보 없음"),
-                "주소": addr.get("jibunAddress", ""),
-                "위도": float(addr.get("y", 0)),
-                "경도": float(addr.get("x", 0))
-            })
-        return places
-    except Exception:
-        return None
+    data = await _get_json(session, url, headers, params)
+    if data.get("status") != "OK" or not data.get("addresses"):
+        return _empty_places()
+
+    addr = data["addresses"][0]
+    return {
+        "이름": [addr.get("roadAddress", "주소 정보 없음")],
+        "주소": [addr.get("jibunAddress", "")],
+        "위도": [float(addr.get("y", 0))],
+        "경도": [float(addr.get("x", 0))]
+    }
+
+@st.cache_data(**API_CACHE)
+def search_naver_geocode(query):
+    return _submit(_fetch_naver_geocode(_http_session(), query)).result()
 
 # 4. 네이버 스마트 검색 통합 함수
+class NaverLocalSearchError(Exception):
+    """
+    지역 검색은 실패했지만 주소 검색 결과는 있을 때 발생합니다.
+    대체 결과를 반환값이 아닌 예외에 담아 st.cache_data에 캐싱되지 않게 합니다.
+    """
+    def __init__(self, local_error, fallback):
+        super().__init__(str(local_error))
+        self.local_error = local_error
+        self.fallback = fallback
+
 def smart_search_naver(keyword, display, sort):
-    results = search_naver_local(keyword, display, sort)
-    if results:
+    # 주소 검색은 지역 검색 결과를 기다리지 않고 미리 시작합니다.
+    # 지역 검색 결과가 있으면 주소 검색 결과는 기다리지 않고 버립니다.
+    # 이미 보낸 주소 검색 요청은 취소할 수 없으므로 끝까지 실행되어 캐시만 채웁니다.
+    # 대소문자/공백만 다른 주소는 같은 캐시 항목을 쓰도록 정규화합니다.
+    executor = _thread_pool(max_workers=1)
+    geocode_future = executor.submit(search_naver_geocode, keyword.strip().lower())
+    executor.shutdown(wait=False)
+
+    # 지역 검색 오류는 예외로 올려 보냅니다. 주소 검색 결과로 대신 반환하면
+    # prepare_naver가 그 결과를 캐싱해, 지역 검색이 복구된 뒤에도 다시 시도하지 않습니다.
+    # 주소 검색 결과가 있으면 화면에 오류와 함께 보여줄 수 있도록 예외에 담습니다.
+    try:
+        results = search_naver_local(keyword, display, sort)
+    except Exception as local_error:
+        try:
+            fallback = geocode_future.result()
+        except Exception:
+            fallback = None
+        if place_count(fallback):
+            raise NaverLocalSearchError(local_error, fallback) from local_error
+        raise
+    if place_count(results):
         return results, "지역 검색"
 
-    st.info("ℹ️ 상호명 검색 결과가 없습니다. 주소 검색을 시도합니다...")
-    results = search_naver_geocode(keyword)
-
-    if results:
+    # 오류는 "결과 없음"으로 캐싱되지 않도록 그대로 올려 보냅니다.
+    results = geocode_future.result()
+    if place_count(results):
         return results, "주소 검색 (Geocoding)"
-    else:
-        return None, "검색 실패"
+    return None, "검색 실패"
+
+# --- 지도용 데이터 준비 ---
+# DataFrame 생성과 좌표 정제까지 캐싱해 같은 검색 조건의 rerun은 바로 그립니다.
+# 한쪽 API 오류가 다른 쪽 결과를 막지 않도록 티맵/네이버를 따로 캐싱합니다.
+# pandas는 첫 화면에는 필요 없으므로 실제로 검색할 때 불러옵니다. (import는 프로세스당 한 번만 실행됩니다)
+MAP_CACHE = dict(ttl=3600, max_entries=256, show_spinner=False)
+
+def result_frames(places):
+    """검색 결과 DataFrame과 지도용으로 정제한 DataFrame을 반환합니다. 결과가 없으면 (None, None)."""
+    import pandas as pd
+
+    if not place_count(places):
+        return None, None
+    df = pd.DataFrame(places)
+    return df, df[_korea_mask(df)]
+
+@st.cache_data(**MAP_CACHE)
+def prepare_tmap(query):
+    """티맵 결과 DataFrame과 지도용으로 정제한 DataFrame을 반환합니다. 결과가 없으면 (None, None)."""
+    return result_frames(search_tmap(query, 10))
+
+@st.cache_data(**MAP_CACHE)
+def prepare_naver(query, display, sort):
+    """네이버 결과 DataFrame, 지도용 DataFrame, 적용된 검색 방식을 반환합니다."""
+    results, search_type = smart_search_naver(query, display, sort)
+    return (*result_frames(results), search_type)
 
 # --- Streamlit 앱 UI ---
 
@@ -280,7 +400,7 @@ with st.form(key="search_form"):
         # use_container_width=True는 버튼을 컬럼 너비에 꽉 채워줍니다.
         submitted = st.form_submit_button("🚀 검색", type="primary", use_container_width=True)
 
-st.markdown('</div>', unsafe_allow_html=True)
+st.markdown(DIV_CLOSE, unsafe_allow_html=True)
 
 # 검색 옵션
 with st.expander("⚙️ 네이버 지역 검색 옵션 설정"):
@@ -294,7 +414,7 @@ with st.expander("⚙️ 네이버 지역 검색 옵션 설정"):
 
     sort_param = "random" if sort_option_label == "정확도순 (기본)" else "comment"
 
-    st.markdown('</div>', unsafe_allow_html=True)
+    st.markdown(DIV_CLOSE, unsafe_allow_html=True)
 
 st.markdown("---")
 
@@ -310,33 +430,29 @@ if submitted:
 
         col1, col2 = st.columns(2)
 
+        # 티맵과 네이버 API는 서로 독립적이므로 동시에 호출합니다.
+        # 캐시된 검색 함수는 동기 함수이므로 워커 스레드에서 실행합니다.
+        executor = _thread_pool(max_workers=3)
+        tmap_future = executor.submit(prepare_tmap, search_query)
+        naver_future = executor.submit(prepare_naver, search_query, naver_display_count, sort_param)
+        executor.shutdown(wait=False)
+
         # 티맵 검색 결과
         with col1:
-            st.markdown('<div class="result-card">', unsafe_allow_html=True)
+            st.markdown(RESULT_CARD_OPEN, unsafe_allow_html=True)
             st.markdown('<div class="section-header">📍 티맵 검색 결과</div>', unsafe_allow_html=True)
 
             with st.spinner("🔄 티맵 검색 중..."):
-                tmap_results = search_tmap(search_query, 10)
-
-                if tmap_results:
+                try:
+                    df_tmap, df_tmap_clean = tmap_future.result()
+                except Exception as e:
+                    st.error(f"⚠️ 티맵 API 오류: {e}")
+                    df_tmap, df_tmap_clean = None, None
+
+                tmap_count = len(df_tmap) if df_tmap is not None else 0
+                if tmap_count:
                     with stat_col1:
-                        st.markdown(f'<div class="stat-box">티맵<br/>{len(tmap_results)}개</div>', unsafe_allow_html=True)
-
-                    df_tmap = pd.DataFrame(tmap_results)
-
-                    # (수정) 아래 디버그 메시지를 삭제했습니다.
-                    # st.write("🔍 DEBUG - 티맵 원본 좌표:", df_tmap[['이름', '위도', '경도']].head())
-
-                    # 좌표 정제: 한국 범위로 제한
-                    df_tmap_clean = df_tmap.copy()
-                    df_tmap_clean = df_tmap_clean[
-                        (pd.notna(df_tmap_clean['위도'])) & 
-                        (pd.notna(df_tmap_clean['경도'])) &
-                        (df_tmap_clean['위도'] > 33) &
-                        (df_tmap_clean['위도'] < 43) &
-                        (df_tmap_clean['경도'] > 124) &
-                        (df_tmap_clean['경도'] < 132)
-                    ]
+                        st.markdown(STAT_BOX.format(label="티맵", count=tmap_count), unsafe_allow_html=True)
 
                     # (수정) 아래 디버그 메시지를 삭제했습니다.
                     # st.write(f"✅ 티맵 유효 좌표: {len(df_tmap_clean)}개 / {len(df_tmap)}개")
@@ -350,7 +466,7 @@ if submitted:
 
                     # 지도
                     st.markdown("**🗺️ 지도 위치**")
-                    st.markdown('<div class="map-container">', unsafe_allow_html=True)
+                    st.markdown(MAP_CONTAINER_OPEN, unsafe_allow_html=True)
                     if len(df_tmap_clean) > 0:
                         try:
                             st.map(df_tmap_clean, latitude='위도', longitude='경도', size=20, color='#667eea')
@@ -358,42 +474,43 @@ if submitted:
                             st.error(f"지도 표시 오류: {e}")
                     else:
                         st.warning("⚠️ 유효한 좌표 정보가 없어 지도를 표시할 수 없습니다.")
-                    st.markdown('</div>', unsafe_allow_html=True)
+                    st.markdown(DIV_CLOSE, unsafe_allow_html=True)
                 else:
                     with stat_col1:
-                        st.markdown('<div class="stat-box">티맵<br/>0개</div>', unsafe_allow_html=True)
+                        st.markdown(STAT_BOX.format(label="티맵", count=0), unsafe_allow_html=True)
                     st.info("ℹ️ 티맵 검색 결과가 없습니다.")
 
-            st.markdown('</div>', unsafe_allow_html=True)
+            st.markdown(DIV_CLOSE, unsafe_allow_html=True)
 
         # 네이버 검색 결과
         with col2:
-            st.markdown('<div class="result-card">', unsafe_allow_html=True)
+            st.markdown(RESULT_CARD_OPEN, unsafe_allow_html=True)
             st.markdown('<div class="section-header">✅ 네이버 스마트 검색 결과</div>', unsafe_allow_html=True)
 
             with st.spinner("🔄 네이버 검색 중..."):
-                naver_results, search_type = smart_search_naver(search_query, naver_display_count, sort_param)
-
-                if naver_results:
+                local_failed = False
+                try:
+                    df_naver, df_naver_clean, search_type = naver_future.result()
+                except NaverLocalSearchError as e:
+                    # 지역 검색 오류를 알리고, 캐싱되지 않은 주소 검색 결과를 대신 보여줍니다.
+                    st.error(f"네이버 API 오류: {e.local_error}")
+                    df_naver, df_naver_clean = result_frames(e.fallback)
+                    search_type = "주소 검색 (Geocoding)"
+                    local_failed = True
+                except Exception as e:
+                    st.error(f"네이버 API 오류: {e}")
+                    df_naver, df_naver_clean, search_type = None, None, "검색 실패"
+
+                naver_count = len(df_naver) if df_naver is not None else 0
+                if naver_count:
                     with stat_col2:
-                        st.markdown(f'<div class="stat-box">네이버<br/>{len(naver_results)}개</div>', unsafe_allow_html=True)
+                        st.markdown(STAT_BOX.format(label="네이버", count=naver_count), unsafe_allow_html=True)
 
+                    if local_failed:
+                        st.info("ℹ️ 상호명 검색에 실패해 주소 검색 결과를 표시합니다.")
+                    elif search_type != "지역 검색":
+                        st.info("ℹ️ 상호명 검색 결과가 없어 주소 검색 결과를 표시합니다.")
                     st.success(f"✨ {search_type} 적용")
-                    df_naver = pd.DataFrame(naver_results)
-
-                    # (수정) 아래 세 줄의 디버그 메시지를 삭제했습니다.
-                    # st.write("🔍 DEBUG - 네이버 원본 좌표:", df_naver[['이름', '위도', '경도']].head())
-
-                    # 좌표 정제: 한국 범위로 제한
-                    df_naver_clean = df_naver.copy()
-                    df_naver_clean = df_naver_clean[
-                        (pd.notna(df_naver_clean['위도'])) & 
-                        (pd.notna(df_naver_clean['경도'])) &
-                        (df_naver_clean['위도'] > 33) &
-                        (df_naver_clean['위도'] < 43) &
-                        (df_naver_clean['경도'] > 124) &
-                        (df_naver_clean['경도'] < 132)
-                    ]
 
                     # (수정) 아래 두 줄의 디버그 메시지를 삭제했습니다.
                     # st.write(f"✅ 네이버 유효 좌표: {len(df_naver_clean)}개 / {len(df_naver)}개")
@@ -410,7 +527,7 @@ if submitted:
 
                     # 지도
                     st.markdown("**🗺️ 지도 위치**")
-                    st.markdown('<div class="map-container">', unsafe_allow_html=True)
+                    st.markdown(MAP_CONTAINER_OPEN, unsafe_allow_html=True)
                     if len(df_naver_clean) > 0:
                         try:
                             st.map(df_naver_clean, latitude='위도', longitude='경도', size=20, color='#03c75a')
@@ -418,19 +535,19 @@ if submitted:
                             st.error(f"지도 표시 오류: {e}")
                     else:
                         st.warning("⚠️ 유효한 좌표 정보가 없어 지도를 표시할 수 없습니다.")
-                    st.markdown('</div>', unsafe_allow_html=True)
+                    st.markdown(DIV_CLOSE, unsafe_allow_html=True)
                 else:
                     with stat_col2:
-                        st.markdown('<div class="stat-box">네이버<br/>0개</div>', unsafe_allow_html=True)
+                        st.markdown(STAT_BOX.format(label="네이버", count=0), unsafe_allow_html=True)
                     st.info("ℹ️ 네이버 검색 결과가 없습니다.")
 
-            st.markdown('</div>', unsafe_allow_html=True)
+            st.markdown(DIV_CLOSE, unsafe_allow_html=True)
 
 
         # 전체 통계
         with stat_col3:
-            total_count = (len(tmap_results) if tmap_results else 0) + (len(naver_results) if naver_results else 0)
-            st.markdown(f'<div class="stat-box">전체<br/>{total_count}개</div>', unsafe_allow_html=True)
+            total_count = tmap_count + naver_count
+            st.markdown(STAT_BOX.format(label="전체", count=total_count), unsafe_allow_html=True)
 
 # 푸터
 st.markdown("---")